@@ -33,7 +33,9 @@ class CapabilityAgent:
         model = model_name or config["LLM_MODELS"]["basic"]
         self.llm = llm or ChatOpenAI(temperature=0, model=model, streaming=True)
 
-        self.strategy = asyncio.run(self.profile_manager.get_strategy())
+        # Capabilities are prefetched alongside the strategy so the first tool call
+        # is served from the ProfileManager cache
+        self.strategy, _ = asyncio.run(self.profile_manager.warm_up())
         logger.info(f"Strategy loaded for context using model: {model}")
 
         self.graph = self._build_graph()
@@ -186,13 +188,7 @@ Remember: ALWAYS use at least one tool before responding, even for seemingly sim
             )
 
             # Extract and store the response
-            last_message = response["messages"][-1]
-            if hasattr(last_message, "content"):
-                response_content = last_message.content
-            elif isinstance(last_message, tuple):
-                response_content = last_message[1]
-            else:
-                response_content = str(last_message)
+            response_content = self._message_content(response["messages"][-1])
 
             # Add response to history
             self.message_history.append(("assistant", response_content))
@@ -207,6 +203,15 @@ Remember: ALWAYS use at least one tool before responding, even for seemingly sim
             logger.error(f"Error processing message: {str(e)}")
             return f"Error processing message: {str(e)}"
 
+    @staticmethod
+    def _message_content(message) -> str:
+        """Extract text from a graph message (message object or role tuple)"""
+        if hasattr(message, "content"):
+            return message.content
+        if isinstance(message, tuple):
+            return message[1]
+        return str(message)
+
     async def clear_history(self):
         """Clear the conversation history"""
         self.message_history = []
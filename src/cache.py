@@ -1,3 +1,5 @@
+from typing import Any, List
+
 from diskcache import Cache
 
 
@@ -13,6 +15,11 @@ class CacheManager:
         """Retrieve a value from the cache by key. Returns None if not found."""
         return self.cache.get(key)
 
+    def get_many(self, keys: List[str]) -> List[Any]:
+        """Retrieve several values in one cache transaction, None for misses."""
+        with self.cache.transact():
+            return [self.cache.get(key) for key in keys]
+
     def clear(self) -> None:
         """Clear the entire cache."""
         self.cache.clear()
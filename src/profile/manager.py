@@ -1,5 +1,7 @@
-import re
-from typing import Dict, List, Optional
+import asyncio
+import time
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from src.utils.logger import get_logger
 
@@ -11,27 +13,74 @@ logger = get_logger(__name__)
 class ProfileManager:
     """Manages access to profile data with advanced querying and analysis capabilities"""
 
-    def __init__(self, data_source: ProfileDataSource):
+    def __init__(
+        self, data_source: ProfileDataSource, cache_ttl: Optional[float] = 3600.0
+    ):
         self.data_source = data_source
+        # Seconds before cached profile data is refetched (None keeps it forever)
+        self.cache_ttl = cache_ttl
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        # Capabilities grouped by lowercased category/level, valid only for the
+        # capabilities list they were built from
+        self._index: Dict[str, Dict[str, List[Dict]]] = {}
+        self._index_source: Optional[List[Dict]] = None
         logger.info("ProfileManager initialized")
 
     async def get_strategy(self) -> Dict[str, str]:
-        """Get the strategy content from the data source"""
-        return await self.data_source.get_strategy()
+        """Get the strategy content from the data source (cached)"""
+        return await self._cached("strategy", self.data_source.get_strategy)
 
     async def get_capabilities(self) -> List[Dict]:
-        """Get all capabilities"""
-        return await self.data_source.get_capabilities()
+        """Get all capabilities (cached; callers get their own copy of the list)"""
+        return list(await self._cached_capabilities())
+
+    async def warm_up(self) -> Tuple[Dict[str, str], List[Dict]]:
+        """Fetch strategy and capabilities concurrently and cache both"""
+        strategy, capabilities = await asyncio.gather(
+            self.get_strategy(), self.get_capabilities()
+        )
+        return strategy, capabilities
+
+    def clear_cache(self) -> None:
+        """Drop cached profile data so the next call hits the data source"""
+        self._cache.clear()
+        self._index = {}
+        self._index_source = None
+        logger.debug("ProfileManager cache cleared")
 
     async def get_capabilities_by_category(self, category: str) -> List[Dict]:
         """Get capabilities filtered by category"""
-        capabilities = await self.get_capabilities()
-        return [
-            cap for cap in capabilities if cap["category"].lower() == category.lower()
-        ]
+        capabilities = await self._cached_capabilities()
+        return self._lookup(capabilities, "category", category)
 
     async def get_capabilities_by_level(self, level: str) -> List[Dict]:
         """Get capabilities filtered by level"""
         logger.debug(f"Getting capabilities by level: {level}")
-        capabilities = await self.get_capabilities()
-        return [cap for cap in capabilities if cap["level"].lower() == level.lower()]
+        capabilities = await self._cached_capabilities()
+        return self._lookup(capabilities, "level", level)
+
+    async def _cached(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Return a cached payload, refetching it once it is older than cache_ttl"""
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        if entry is None or (
+            self.cache_ttl is not None and now - entry[0] >= self.cache_ttl
+        ):
+            entry = self._cache[key] = (now, await fetch())
+        return entry[1]
+
+    async def _cached_capabilities(self) -> List[Dict]:
+        """The shared cached list; the lookup index is keyed on its identity"""
+        return await self._cached("capabilities", self.data_source.get_capabilities)
+
+    def _lookup(self, capabilities: List[Dict], field: str, value: str) -> List[Dict]:
+        """Case-insensitive lookup served from a one-pass index per snapshot"""
+        if capabilities is not self._index_source:
+            index = {"category": defaultdict(list), "level": defaultdict(list)}
+            for cap in capabilities:
+                for key, groups in index.items():
+                    groups[cap[key].lower()].append(cap)
+            self._index, self._index_source = index, capabilities
+
+        # Hand out a copy so callers cannot mutate the shared index
+        return list(self._index[field].get(value.lower(), []))
@@ -1,8 +1,10 @@
+from collections import OrderedDict
 from datetime import datetime
 from typing import Any, Dict, Generic, List, Optional, Tuple, TypeVar, Union
 
 from bson import ObjectId
 from bson.errors import InvalidId
+from langchain_core.embeddings import Embeddings
 from langchain_openai import OpenAIEmbeddings
 
 from src.utils.logger import get_logger
@@ -13,15 +15,26 @@ logger = get_logger(__name__)
 
 T = TypeVar("T")
 
+QUERY_EMBEDDING_CACHE_SIZE = 64
+
 
 class BaseRepository(Generic[T]):
     """Base repository with common operations"""
 
-    def __init__(self, db: MongoDB, collection_name: str, entity_name: str):
+    def __init__(
+        self,
+        db: MongoDB,
+        collection_name: str,
+        entity_name: str,
+        embeddings: Optional[Embeddings] = None,
+    ):
         self.db = db
         self.collection = self.db.db[collection_name]
         self._entity_name = entity_name
-        self.embeddings = OpenAIEmbeddings()
+        self.embeddings = embeddings or OpenAIEmbeddings()
+        # Recent search-query vectors, so repeated similarity searches for the
+        # same text skip the embeddings API
+        self._query_embeddings: OrderedDict[str, List[float]] = OrderedDict()
 
     # === Core CRUD Operations ===
     async def get(self, id: str) -> T:
@@ -47,16 +60,16 @@ class BaseRepository(Generic[T]):
             raise RepositoryError(f"{self._entity_name} read failed: {str(e)}")
 
     async def update(self, id: str, update_data: Union[dict, T]) -> bool:
-        """Update entity with specific fields"""
+        """Update entity with specific fields (a passed-in dict is not mutated)"""
         try:
             # Convert Pydantic model to dict if needed
-            update_dict = (
+            fields = (
                 update_data.model_dump(exclude={"id"}, by_alias=True, exclude_none=True)
                 if hasattr(update_data, "model_dump")
                 else update_data
             )
 
-            update_dict["updated_at"] = datetime.now()
+            update_dict = {**fields, "updated_at": datetime.now()}
             result = await self.collection.update_one(
                 {"_id": ObjectId(id)}, {"$set": update_dict}
             )
@@ -92,11 +105,15 @@ class BaseRepository(Generic[T]):
         page: int = 1,
         page_size: int = 10,
         sort_by: str = None,
+        projection: Optional[Dict[str, Any]] = None,
+        batch_size: Optional[int] = None,
     ) -> Tuple[List[T], int]:
         """Get paginated results with total count"""
         try:
             skip = (page - 1) * page_size
-            cursor = self.collection.find(query or {})
+            cursor = self.collection.find(query or {}, projection)
+            if batch_size:
+                cursor = cursor.batch_size(batch_size)
 
             if sort_by:
                 cursor = cursor.sort(sort_by)
@@ -150,12 +167,17 @@ class BaseRepository(Generic[T]):
         try:
             # For testing, use simple text matching instead of vector search
             if "test" in self.db.db.name.lower():
-                # Simple text search as a mock
+                # Simple text search as a mock, most relevant matches first
                 query = {"$text": {"$search": text}}
                 if min_score is not None and score_field:
                     query[score_field] = {"$gte": min_score}
 
-                cursor = self.collection.find(query).limit(limit)
+                text_score = {"$meta": "textScore"}
+                cursor = (
+                    self.collection.find(query, {"score": text_score})
+                    .sort([("score", text_score)])
+                    .limit(limit)
+                )
                 docs = await cursor.to_list(length=None)
                 docs = self._process_documents(docs)
                 return [self._from_document(doc) for doc in docs]
@@ -164,7 +186,7 @@ class BaseRepository(Generic[T]):
             pipeline = [
                 {
                     "$vectorSearch": {
-                        "queryVector": await self._generate_embeddings(text),
+                        "queryVector": await self._embed_query(text),
                         "path": embedding_field,
                         "numCandidates": limit * 10,
                         "limit": limit,
@@ -205,6 +227,24 @@ class BaseRepository(Generic[T]):
         """Generate embeddings for text using OpenAI"""
         return await self.embeddings.aembed_query(text)
 
+    async def _embed_query(self, text: str) -> List[float]:
+        """Embed a search query, reusing vectors for recently seen queries"""
+        # Keyed on the exact text: embeddings are case- and spacing-sensitive, so a
+        # normalized key would make results depend on which variant came first
+        if text in self._query_embeddings:
+            self._query_embeddings.move_to_end(text)
+            return self._query_embeddings[text]
+
+        embedding = await self._generate_embeddings(text)
+        self._query_embeddings[text] = embedding
+        while len(self._query_embeddings) > QUERY_EMBEDDING_CACHE_SIZE:
+            self._query_embeddings.popitem(last=False)
+        return embedding
+
+    async def _generate_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        """Generate embeddings for several texts in a single OpenAI request"""
+        return await self.embeddings.aembed_documents(texts)
+
     # === Test Helpers ===
     async def cleanup_test_data(self) -> None:
         """Clean up test data - only used in test environment"""
@@ -2,6 +2,8 @@ from datetime import datetime
 from typing import List, Optional
 
 from bson import ObjectId
+from bson.errors import InvalidId
+from langchain_core.embeddings import Embeddings
 
 from src.utils.logger import get_logger
 
@@ -13,17 +15,18 @@ logger = get_logger(__name__)
 
 
 class CompanyRepository(BaseRepository[Company]):
-    def __init__(self, db: MongoDB):
-        super().__init__(db, "companies", "Company")
+    def __init__(self, db: MongoDB, embeddings: Optional[Embeddings] = None):
+        super().__init__(db, "companies", "Company", embeddings)
 
     # === Core CRUD Operations ===
-    async def create(self, company: Company) -> str:
-        """Create a new company with embeddings"""
+    async def create(self, company: Company, compute_embedding: bool = True) -> str:
+        """Create a new company, with embeddings unless compute_embedding is False"""
         try:
             # Generate embeddings for description only
-            company.description_embedding = await self._generate_embeddings(
-                company.description
-            )
+            if compute_embedding:
+                company.description_embedding = await self._generate_embeddings(
+                    company.description
+                )
             company_dict = self._to_document(company)
             result = await self.collection.insert_one(company_dict)
             logger.info(f"Created {self._entity_name} with ID: {result.inserted_id}")
@@ -32,26 +35,50 @@ class CompanyRepository(BaseRepository[Company]):
             logger.error(f"Failed to create {self._entity_name}: {str(e)}")
             raise RepositoryError(f"{self._entity_name} creation failed: {str(e)}")
 
+    async def create_many(
+        self, companies: List[Company], compute_embedding: bool = True
+    ) -> List[str]:
+        """Create several companies with one embeddings request and one insert"""
+        if not companies:
+            return []
+
+        try:
+            if compute_embedding:
+                embeddings = await self._generate_embeddings_batch(
+                    [company.description for company in companies]
+                )
+                for company, embedding in zip(companies, embeddings):
+                    company.description_embedding = embedding
+
+            # Let the server apply independent inserts unordered, as for jobs
+            result = await self.collection.insert_many(
+                [self._to_document(company) for company in companies], ordered=False
+            )
+            ids = [str(inserted_id) for inserted_id in result.inserted_ids]
+            logger.info(f"Created {len(ids)} {self._entity_name} records")
+            return ids
+        except Exception as e:
+            logger.error(f"Failed to create {self._entity_name} batch: {str(e)}")
+            raise RepositoryError(f"{self._entity_name} bulk creation failed: {str(e)}")
+
     async def update(self, company_id: str, company: Company) -> bool:
         """Update company with stage transition validation"""
         try:
-            # First get the current company state
+            # First get the current stage (the only field validation needs)
             try:
-                current_company = await self.get(company_id)
+                current_stage = await self._get_stage(company_id)
             except EntityNotFoundError:
                 logger.warning(f"Cannot update non-existent company: {company_id}")
                 return False
 
             # Validate stage transition
-            if current_company.stage != company.stage:
-                if self._is_invalid_stage_transition(
-                    current_company.stage, company.stage
-                ):
+            if current_stage != company.stage:
+                if self._is_invalid_stage_transition(current_stage, company.stage):
                     logger.error(
-                        f"Invalid stage transition from {current_company.stage} to {company.stage}"
+                        f"Invalid stage transition from {current_stage} to {company.stage}"
                     )
                     raise ValueError(
-                        f"Cannot transition company from {current_company.stage} to {company.stage}"
+                        f"Cannot transition company from {current_stage} to {company.stage}"
                     )
 
             company_dict = self._to_document(company)
@@ -129,6 +156,30 @@ class CompanyRepository(BaseRepository[Company]):
                 filter_query["created_at"]["$lte"] = filters.date_to
         return filter_query
 
+    async def _get_stage(self, company_id: str) -> CompanyStage:
+        """Fetch only the stored stage, skipping the description embedding"""
+        # Transition rules depend on the stored stage, so unlike match_score they
+        # cannot be enforced by a model validator; one projected read is the floor
+        try:
+            object_id = ObjectId(company_id)
+        except InvalidId:
+            logger.error(f"Invalid {self._entity_name} ID format: {company_id}")
+            raise RepositoryError(
+                f"Invalid {self._entity_name} ID format: {company_id}"
+            )
+
+        try:
+            doc = await self.collection.find_one({"_id": object_id}, {"stage": 1})
+            if not doc:
+                logger.warning(f"{self._entity_name} not found with ID: {company_id}")
+                raise EntityNotFoundError(self._entity_name, company_id)
+            return CompanyStage(doc["stage"])
+        except EntityNotFoundError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to read {self._entity_name} {company_id}: {str(e)}")
+            raise RepositoryError(f"{self._entity_name} read failed: {str(e)}")
+
     def _is_invalid_stage_transition(
         self, current_stage: CompanyStage, new_stage: CompanyStage
     ) -> bool:
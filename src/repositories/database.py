@@ -8,6 +8,14 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Keep a few warm connections so concurrent repository calls don't pay the
+# connect/auth handshake, and fail fast when the server is unreachable
+CLIENT_OPTIONS = {
+    "maxPoolSize": 10,
+    "minPoolSize": 2,
+    "serverSelectionTimeoutMS": 5000,
+}
+
 
 class RepositoryError(Exception):
     """Base exception for repository operations"""
@@ -43,7 +51,7 @@ class MongoDB:
             cls._instance = None
 
     def __init__(self, is_test: bool = False):
-        self.client = AsyncIOMotorClient(config["MONGODB_URI"])
+        self.client = AsyncIOMotorClient(config["MONGODB_URI"], **CLIENT_OPTIONS)
         db_name = (
             f"{config['MONGODB_DB_NAME']}-test"
             if is_test
@@ -62,9 +70,14 @@ class MongoDB:
 
             # Regular indexes for companies
             await self.db.companies.create_index("name")
-            await self.db.companies.create_index("industry")
             await self.db.companies.create_index("stage")
+            # Compound index serves industry+stage filters with an optional
+            # minimum fit score and, as a prefix, industry-only filters
+            await self.db.companies.create_index(
+                [("industry", 1), ("stage", 1), ("company_fit_score", -1)]
+            )
             await self.db.companies.create_index("company_fit_score")
+            await self.db.companies.create_index("created_at")
 
             # Unique compound index for companies
             await self.db.companies.create_index(
@@ -74,8 +87,14 @@ class MongoDB:
             )
 
             # Regular indexes for jobs
-            await self.db.jobs.create_index("company_id")
-            await self.db.jobs.create_index("active")
+            # Compound index backs get_company_jobs (company_id, optionally active)
+            # and, as a prefix, company_id-only lookups
+            await self.db.jobs.create_index([("company_id", 1), ("active", 1)])
+            # Equality on active then the score range/sort (with the _id tiebreak)
+            # lets get_best_matches read its top results straight off the index
+            await self.db.jobs.create_index(
+                [("active", 1), ("match_score", -1), ("_id", -1)]
+            )
             await self.db.jobs.create_index("match_score")
 
             # Text search indexes
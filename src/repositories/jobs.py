@@ -1,7 +1,10 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, NamedTuple, Optional
 
 from bson import ObjectId
+from langchain_core.embeddings import Embeddings
+from pydantic import TypeAdapter
+from pymongo import UpdateOne
 
 from src.utils.logger import get_logger
 
@@ -11,17 +14,39 @@ from .models import JobAd
 
 logger = get_logger(__name__)
 
+# Documents fetched per round trip when streaming jobs
+STREAM_BATCH_SIZE = 100
+
+# get_company_jobs loads every match, so fetch large batches to avoid the
+# driver's default 101-document first batch forcing extra getMore calls
+COMPANY_JOBS_BATCH_SIZE = 500
+
+# Serializes a whole batch in one call for create_many
+_JOBS_ADAPTER = TypeAdapter(List[JobAd])
+
+
+class JobEvaluation(NamedTuple):
+    """One job's evaluation result, as applied by update_evaluations_bulk"""
+
+    job_id: str
+    match_score: float
+    skills_match: List[str]
+    notes: Optional[str] = None
+
 
 class JobRepository(BaseRepository[JobAd]):
-    def __init__(self, db: MongoDB):
-        super().__init__(db, "jobs", "Job")
+    def __init__(self, db: MongoDB, embeddings: Optional[Embeddings] = None):
+        super().__init__(db, "jobs", "Job", embeddings)
 
     # === Core CRUD Operations ===
-    async def create(self, job: JobAd) -> str:
-        """Create a new job with embeddings"""
+    async def create(self, job: JobAd, compute_embedding: bool = True) -> str:
+        """Create a new job, with embeddings unless compute_embedding is False"""
         try:
             # Generate embeddings for description and requirements
-            job.description_embedding = await self._generate_embeddings(job.description)
+            if compute_embedding:
+                job.description_embedding = await self._generate_embeddings(
+                    job.description
+                )
             job_dict = self._to_document(job)
             result = await self.collection.insert_one(job_dict)
             logger.info(f"Created {self._entity_name} with ID: {result.inserted_id}")
@@ -30,6 +55,35 @@ class JobRepository(BaseRepository[JobAd]):
             logger.error(f"Failed to create {self._entity_name}: {str(e)}")
             raise RepositoryError(f"{self._entity_name} creation failed: {str(e)}")
 
+    async def create_many(
+        self, jobs: List[JobAd], compute_embedding: bool = True
+    ) -> List[str]:
+        """Create several jobs with one embeddings request and one insert"""
+        if not jobs:
+            return []
+
+        try:
+            if compute_embedding:
+                embeddings = await self._generate_embeddings_batch(
+                    [job.description for job in jobs]
+                )
+                for job, embedding in zip(jobs, embeddings):
+                    job.description_embedding = embedding
+
+            # Jobs are independent, so let the server apply them unordered
+            result = await self.collection.insert_many(
+                _JOBS_ADAPTER.dump_python(
+                    jobs, exclude={"__all__": {"id"}}, by_alias=True, exclude_none=True
+                ),
+                ordered=False,
+            )
+            ids = [str(inserted_id) for inserted_id in result.inserted_ids]
+            logger.info(f"Created {len(ids)} {self._entity_name} records")
+            return ids
+        except Exception as e:
+            logger.error(f"Failed to create {self._entity_name} batch: {str(e)}")
+            raise RepositoryError(f"{self._entity_name} bulk creation failed: {str(e)}")
+
     async def update_evaluation(
         self,
         job_id: str,
@@ -50,6 +104,41 @@ class JobRepository(BaseRepository[JobAd]):
         }
         return await self.update(job_id, update_dict)
 
+    async def update_evaluations_bulk(self, evaluations: List[JobEvaluation]) -> int:
+        """Apply several job evaluations in one write"""
+        for evaluation in evaluations:
+            if not 0 <= evaluation.match_score <= 1:
+                logger.error(f"Invalid match score: {evaluation.match_score}")
+                raise ValueError("Match score must be between 0 and 1")
+
+        if not evaluations:
+            return 0
+
+        now = datetime.now()
+        try:
+            operations = [
+                UpdateOne(
+                    {"_id": ObjectId(evaluation.job_id)},
+                    {
+                        "$set": {
+                            "match_score": evaluation.match_score,
+                            "skills_match": evaluation.skills_match,
+                            "evaluation_notes": evaluation.notes,
+                            "evaluated_at": now,
+                            "updated_at": now,
+                        }
+                    },
+                )
+                for evaluation in evaluations
+            ]
+            result = await self.collection.bulk_write(operations, ordered=False)
+            return result.modified_count
+        except Exception as e:
+            logger.error(f"Failed to update {self._entity_name} evaluations: {str(e)}")
+            raise RepositoryError(
+                f"{self._entity_name} bulk evaluation failed: {str(e)}"
+            )
+
     async def archive_job(self, job_id: str) -> bool:
         """Archive a job by marking it as inactive"""
         update_dict = {
@@ -58,27 +147,77 @@ class JobRepository(BaseRepository[JobAd]):
         }
         return await self.update(job_id, update_dict)
 
+    async def archive_jobs(self, job_ids: List[str]) -> int:
+        """Archive several jobs with a single update"""
+        if not job_ids:
+            return 0
+
+        now = datetime.now()
+        try:
+            result = await self.collection.update_many(
+                {"_id": {"$in": [ObjectId(job_id) for job_id in job_ids]}},
+                {"$set": {"active": False, "archived_at": now, "updated_at": now}},
+            )
+            return result.modified_count
+        except Exception as e:
+            logger.error(f"Failed to archive {self._entity_name} batch: {str(e)}")
+            raise RepositoryError(f"{self._entity_name} bulk archive failed: {str(e)}")
+
     # === Query Operations ===
     async def get_company_jobs(
-        self, company_id: str, include_archived: bool = False
+        self,
+        company_id: str,
+        include_archived: bool = False,
+        projection: Optional[Dict[str, Any]] = None,
     ) -> List[JobAd]:
-        """Get all jobs for a company"""
-        query = {"company_id": company_id}
-        if not include_archived:
-            query["active"] = True
+        """Get all jobs for a company.
 
+        projection may only exclude fields other than _id (e.g.
+        {"description_embedding": 0}), so every returned JobAd still carries its
+        id and required fields.
+        """
+        self._check_exclusion_projection(projection)
         results, _ = await self.get_paginated(
-            query=query, page=1, page_size=0  # No limit
+            query=self._company_jobs_query(company_id, include_archived),
+            page=1,
+            page_size=0,  # No limit
+            projection=projection,
+            batch_size=COMPANY_JOBS_BATCH_SIZE,
         )
         return results
 
+    async def stream_company_jobs(
+        self,
+        company_id: str,
+        include_archived: bool = False,
+        projection: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[JobAd]:
+        """Yield a company's jobs one at a time instead of loading them all.
+
+        projection follows get_company_jobs and may only exclude fields.
+        """
+        self._check_exclusion_projection(projection)
+        cursor = self.collection.find(
+            self._company_jobs_query(company_id, include_archived), projection
+        ).batch_size(STREAM_BATCH_SIZE)
+        try:
+            async for doc in cursor:
+                doc["_id"] = str(doc["_id"])
+                yield self._from_document(doc)
+        except Exception as e:
+            logger.error(f"Streaming {self._entity_name} records failed: {str(e)}")
+            raise RepositoryError(f"Streaming failed: {str(e)}")
+
     async def get_best_matches(
         self, min_score: float = 0.7, limit: int = 10
     ) -> List[JobAd]:
         """Get best matching active jobs above minimum score"""
         query = {"active": True, "match_score": {"$gte": min_score}}
         results, _ = await self.get_paginated(
-            query=query, page=1, page_size=limit, sort_by=[("match_score", -1)]
+            query=query,
+            page=1,
+            page_size=limit,
+            sort_by=[("match_score", -1), ("_id", -1)],  # _id breaks score ties
         )
         return results
 
@@ -93,6 +232,21 @@ class JobRepository(BaseRepository[JobAd]):
         )
 
     # === Utility Methods ===
+    def _check_exclusion_projection(self, projection: Optional[Dict[str, Any]]):
+        """Reject inclusion projections, which would drop required JobAd fields"""
+        if projection and any(projection.values()):
+            raise ValueError("Job projections may only exclude fields")
+        # Every returned JobAd carries its id, so _id cannot be excluded either
+        if projection and "_id" in projection:
+            raise ValueError("Job projections cannot exclude _id")
+
+    def _company_jobs_query(self, company_id: str, include_archived: bool) -> dict:
+        """Filter for a company's jobs, active ones only unless archived wanted"""
+        query = {"company_id": company_id}
+        if not include_archived:
+            query["active"] = True
+        return query
+
     def _from_document(self, doc: dict) -> JobAd:
         """Convert MongoDB document to JobAd"""
         return JobAd(**doc)
@@ -1,13 +1,23 @@
-from typing import Dict, List
+import asyncio
+from typing import Dict, List, Optional
 
+import httpx
 from notion_client import Client
 
 from .base import BaseKnowledge
 
 
 class NotionKnowledge(BaseKnowledge):
-    def __init__(self, api_key: str):
-        self.client = Client(auth=api_key)
+    def __init__(self, api_key: str, http_client: Optional[httpx.Client] = None):
+        # Notion sets its own base URL and auth headers on the client, so only
+        # share an http_client between Notion instances using the same key
+        self.client = Client(auth=api_key, client=http_client)
+        self._owns_client = http_client is None
+
+    def close(self) -> None:
+        """Release the HTTP connection pool unless it was supplied by the caller"""
+        if self._owns_client:
+            self.client.close()
 
     def _get_rich_text_content(self, rich_text_list: List[Dict]) -> str:
         """Helper to extract text from rich_text array"""
@@ -50,10 +60,14 @@ class NotionKnowledge(BaseKnowledge):
             has_more = True
             next_cursor = None
 
-            # Paginate through all blocks
+            # Paginate through all blocks. The Notion client is synchronous, so
+            # requests run in a worker thread and independent fetches can overlap
             while has_more:
-                response = self.client.blocks.children.list(
-                    block_id=page_id, start_cursor=next_cursor, page_size=100
+                response = await asyncio.to_thread(
+                    self.client.blocks.children.list,
+                    block_id=page_id,
+                    start_cursor=next_cursor,
+                    page_size=100,
                 )
                 all_blocks.extend(response["results"])
                 has_more = response["has_more"]
@@ -77,7 +91,9 @@ class NotionKnowledge(BaseKnowledge):
     async def get_capabilities(self, database_id: str) -> List[Dict]:
         """Fetch capabilities from Notion database"""
         try:
-            response = self.client.databases.query(database_id=database_id)
+            response = await asyncio.to_thread(
+                self.client.databases.query, database_id=database_id
+            )
 
             # Transform the response to a simpler format
             capabilities = []
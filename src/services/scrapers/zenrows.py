@@ -1,5 +1,7 @@
 import asyncio
 import json
+from contextlib import nullcontext
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
 
@@ -11,9 +13,24 @@ from src.services.scrapers.base import BaseScraper, ScraperResponse
 from src.utils.logger import get_logger
 
 
+@lru_cache(maxsize=4096)
+def _is_valid_url(url: str) -> bool:
+    """Check a URL has a scheme and host, memoized for repeated URLs"""
+    try:
+        result = urlparse(url)
+    except ValueError:
+        return False
+    return bool(result.scheme and result.netloc)
+
+
 class ZenrowsScraper(BaseScraper):
-    def __init__(self, api_key: str = None, options: Dict[str, Any] = None):
-        """Initialize ZenRows scraper with API key and options"""
+    def __init__(
+        self,
+        api_key: str = None,
+        options: Dict[str, Any] = None,
+        max_concurrency: int = 10,
+    ):
+        """Initialize ZenRows scraper with API key, options and concurrency limit"""
         self.api_key = api_key or config["ZENROWS_API_KEY"]
         if not self.api_key:
             raise ValueError("ZenRows API key not found")
@@ -22,15 +39,15 @@ class ZenrowsScraper(BaseScraper):
         self.client = ZenRowsClient(self.api_key)
         self.logger = get_logger(__name__)
         self.cache = CacheManager()
+        # Caps in-flight ZenRows requests when scraping many URLs at once
+        self.max_concurrency = max_concurrency
 
     def _validate_url(self, url: str) -> bool:
         """Validate URL format"""
-        try:
-            result = urlparse(url)
-            return all([result.scheme, result.netloc])
-        except Exception as e:
-            self.logger.error(f"Invalid URL format: {url}")
-            return False
+        if _is_valid_url(url):
+            return True
+        self.logger.error(f"Invalid URL format: {url}")
+        return False
 
     def _prepare_request_params(self, **kwargs) -> Dict[str, Any]:
         """Prepare request parameters by merging defaults with custom params"""
@@ -64,6 +81,17 @@ class ZenrowsScraper(BaseScraper):
             )
             return cached_response
 
+        return await self._fetch(url, params, cache_key, retries)
+
+    async def _fetch(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        cache_key: str,
+        retries: int,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> ScraperResponse:
+        """Request a URL from ZenRows with retries and cache a successful response"""
         last_error = None
 
         for attempt in range(retries):
@@ -71,7 +99,11 @@ class ZenrowsScraper(BaseScraper):
                 self.logger.info(
                     f"Scraping {url} (attempt {attempt + 1}/{retries}) with params {params}"
                 )
-                response = self.client.get(url, params=params)
+                # The ZenRows client is blocking, so run it off the event loop
+                async with semaphore or nullcontext():
+                    response = await asyncio.to_thread(
+                        self.client.get, url, params=params
+                    )
 
                 # Create ScraperResponse object
                 scraper_response = ScraperResponse(
@@ -102,8 +134,31 @@ class ZenrowsScraper(BaseScraper):
                         metadata={"attempts": attempt + 1},
                     )
 
-    async def scrape_multiple(self, urls: List[str], **kwargs) -> List[ScraperResponse]:
-        """Scrape multiple URLs"""
-        tasks = [self.scrape(url, **kwargs) for url in urls]
-        results = await asyncio.gather(*tasks)
+    async def scrape_multiple(
+        self, urls: List[str], retries: int = 3, **kwargs
+    ) -> List[ScraperResponse]:
+        """Scrape multiple URLs, checking the cache for all of them at once"""
+        for url in urls:
+            if not self._validate_url(url):
+                raise ValueError(f"Invalid URL: {url}")
+
+        params = self._prepare_request_params(**kwargs)
+        cache_keys = [self._generate_cache_key(url, params) for url in urls]
+        results = self.cache.get_many(cache_keys)
+
+        misses = [i for i, cached in enumerate(results) if not cached]
+        self.logger.info(
+            f"Returning {len(urls) - len(misses)} cached responses, "
+            f"scraping {len(misses)} URLs"
+        )
+        # Created per call so it binds to the loop running this batch
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        fetched = await asyncio.gather(
+            *(
+                self._fetch(urls[i], params, cache_keys[i], retries, semaphore)
+                for i in misses
+            )
+        )
+        for i, response in zip(misses, fetched):
+            results[i] = response
         return results
@@ -1,9 +1,11 @@
 import logging
 import sys
+from functools import lru_cache
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str, level: int = logging.INFO) -> logging.Logger:
-    """Get a logger instance with the specified name."""
+    """Get a logger instance with the specified name (cached per name and level)."""
     logger = logging.getLogger(name)
 
     if not logger.handlers:  # Only add handler if it doesn't exist
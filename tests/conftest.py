@@ -0,0 +1,128 @@
+import asyncio
+import os
+import random
+import re
+
+import httpx
+import pytest
+from pytest_asyncio import is_async_test
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--loop",
+        choices=("uvloop", "asyncio"),
+        default="uvloop",
+        help="Event loop implementation for async tests (default: uvloop)",
+    )
+    parser.addoption(
+        "--live",
+        action="store_true",
+        default=False,
+        help="Run tests marked 'live' against real LLM and web services",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Run async tests on the session loop; skip live tests unless --live is given"""
+    session_scope_marker = pytest.mark.asyncio(loop_scope="session")
+    skip_live = pytest.mark.skip(reason="live test, run with --live")
+    run_live = config.getoption("--live")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_scope_marker, append=False)
+        if not run_live and "live" in item.keywords:
+            item.add_marker(skip_live)
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy(request):
+    """Use libuv-backed loops unless --loop=asyncio or uvloop is unavailable"""
+    if request.config.getoption("--loop") == "uvloop":
+        try:
+            import uvloop
+
+            return uvloop.EventLoopPolicy()
+        except ImportError:
+            pass
+    return asyncio.DefaultEventLoopPolicy()
+
+
+@pytest.fixture
+def rng(request):
+    """Seeded RNG so sampled prompts are stable across runs (override via TEST_SEED)"""
+    # Seeding per test keeps picks stable regardless of test order or xdist worker
+    return random.Random(f"{os.getenv('TEST_SEED', '42')}:{request.node.nodeid}")
+
+
+@pytest.fixture
+def log_response(request):
+    """Print LLM/API output only under -vv to keep capture buffers and CI logs small"""
+    verbose = request.config.getoption("verbose") >= 2
+
+    def log(label, content):
+        if verbose:
+            print(f"\n{label}:\n{content}")
+
+    return log
+
+
+@pytest.fixture(scope="session")
+def http_client():
+    """Pooled HTTP client reused by every Notion-backed fixture"""
+    limits = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+    with httpx.Client(limits=limits) as client:
+        yield client
+
+
+# Account identifiers and contact details kept out of recorded cassettes
+_SCRUBBED_RESPONSE_HEADERS = {"set-cookie", "openai-organization", "openai-project"}
+_EMAIL_PATTERN = re.compile(rb"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+
+
+def scrub_response(response):
+    """Strip account headers and email addresses from a response before recording"""
+    response["headers"] = {
+        name: value
+        for name, value in response["headers"].items()
+        if name.lower() not in _SCRUBBED_RESPONSE_HEADERS
+    }
+    body = response["body"].get("string")
+    if isinstance(body, bytes):
+        response["body"]["string"] = _EMAIL_PATTERN.sub(b"redacted@example.com", body)
+    return response
+
+
+def scrub_request(request):
+    """Redact email addresses from a request body before recording"""
+    if isinstance(request.body, bytes):
+        request.body = _EMAIL_PATTERN.sub(b"redacted@example.com", request.body)
+    return request
+
+
+@pytest.fixture(scope="module")
+def vcr_config(request):
+    """Replay LLM/Notion traffic from cassettes; only record new ones outside CI"""
+    # An explicit --record-mode (e.g. rewrite to re-record) wins locally, but CI
+    # must never hit the network or write personal profile data
+    record_mode = request.config.getoption("--record-mode", None)
+    if os.getenv("CI"):
+        record_mode = "none"
+    elif record_mode in (None, "none"):
+        record_mode = "once"
+    return {
+        "filter_headers": [
+            "authorization",
+            "api-key",
+            "x-api-key",
+            "cookie",
+            "openai-organization",
+            "openai-project",
+        ],
+        # Bodies must be decompressed for the scrubber to see them
+        "decode_compressed_response": True,
+        "before_record_request": scrub_request,
+        "before_record_response": scrub_response,
+        "record_mode": record_mode,
+        "match_on": ["method", "uri", "body"],
+    }
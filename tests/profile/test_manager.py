@@ -0,0 +1,118 @@
+import pytest
+
+from src.profile.base import ProfileDataSource
+from src.profile.manager import ProfileManager
+
+STRATEGY = {"content": "Focus on senior engineering roles."}
+CAPABILITIES = [
+    {
+        "name": "Python",
+        "category": "Hard Skills",
+        "level": "Expert",
+        "experience": "Backend APIs and data pipelines",
+    },
+    {
+        "name": "Mentoring",
+        "category": "Soft Skills",
+        "level": "Advanced",
+        "experience": "Coached junior Python developers",
+    },
+    {"name": "Docker", "category": "Tools/Platforms", "level": "Advanced"},
+]
+
+
+class MockProfileDataSource(ProfileDataSource):
+    """In-memory data source that counts how often it is queried"""
+
+    def __init__(self):
+        self.calls = {"strategy": 0, "capabilities": 0}
+
+    async def get_strategy(self):
+        self.calls["strategy"] += 1
+        return STRATEGY
+
+    async def get_capabilities(self):
+        self.calls["capabilities"] += 1
+        return CAPABILITIES
+
+
+@pytest.fixture(scope="module")
+def data_source():
+    return MockProfileDataSource()
+
+
+@pytest.fixture(scope="module")
+def profile_manager(data_source):
+    return ProfileManager(data_source)
+
+
+@pytest.fixture(autouse=True)
+def reset_state(profile_manager, data_source):
+    """Share one manager per module but start each test with a cold cache"""
+    profile_manager.clear_cache()
+    data_source.calls = dict.fromkeys(data_source.calls, 0)
+
+
+@pytest.mark.asyncio
+async def test_profile_data_is_cached(profile_manager, data_source):
+    """Test that repeated lookups are served without re-querying the source"""
+    await profile_manager.get_strategy()
+    await profile_manager.get_strategy()
+    await profile_manager.get_capabilities_by_category("hard skills")
+    await profile_manager.get_capabilities_by_level("Advanced")
+
+    assert data_source.calls == {"strategy": 1, "capabilities": 1}
+
+
+@pytest.mark.asyncio
+async def test_clear_cache(profile_manager, data_source):
+    """Test that clearing the cache forces a fresh fetch"""
+    await profile_manager.get_capabilities()
+    profile_manager.clear_cache()
+    await profile_manager.get_capabilities()
+
+    assert data_source.calls["capabilities"] == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_expires(data_source):
+    """Test that cached data is refetched once it is older than cache_ttl"""
+    profile_manager = ProfileManager(data_source, cache_ttl=0)
+    await profile_manager.get_capabilities()
+    await profile_manager.get_capabilities()
+
+    assert data_source.calls["capabilities"] == 2
+
+
+@pytest.mark.asyncio
+async def test_filters(profile_manager):
+    """Test category and level filters are case-insensitive"""
+    hard_skills = await profile_manager.get_capabilities_by_category("HARD SKILLS")
+    advanced = await profile_manager.get_capabilities_by_level("advanced")
+
+    assert [cap["name"] for cap in hard_skills] == ["Python"]
+    assert [cap["name"] for cap in advanced] == ["Mentoring", "Docker"]
+    assert await profile_manager.get_capabilities_by_level("Basic") == []
+
+
+@pytest.mark.asyncio
+async def test_warm_up(profile_manager, data_source):
+    """Test that warm-up fetches both payloads once and primes the cache"""
+    strategy, capabilities = await profile_manager.warm_up()
+    await profile_manager.get_capabilities()
+
+    assert strategy["content"]
+    assert capabilities == CAPABILITIES
+    assert data_source.calls == {"strategy": 1, "capabilities": 1}
+
+
+@pytest.mark.asyncio
+async def test_filtered_views_are_copies(profile_manager):
+    """Test that mutating returned lists does not leak into later lookups"""
+    first = await profile_manager.get_capabilities_by_level("Advanced")
+    first.clear()
+    (await profile_manager.get_capabilities()).clear()
+    second = await profile_manager.get_capabilities_by_level("ADVANCED")
+
+    assert [cap["name"] for cap in second] == ["Mentoring", "Docker"]
+    assert len(await profile_manager.get_capabilities()) == len(CAPABILITIES)
@@ -1,29 +1,46 @@
+import asyncio
 import json
 
 import pytest
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 from src.config import config
 from src.profile.notion import NotionProfileSource
 from src.services.knowledge.notion import NotionKnowledge
 
+# Every test here reads the personal Notion profile, so none run offline
+pytestmark = [pytest.mark.vcr, pytest.mark.live]
 
-@pytest.fixture
-def profile_source():
-    """Fixture to create a NotionProfileSource instance"""
-    notion_client = NotionKnowledge(config["NOTION_API_KEY"])
-    return NotionProfileSource(notion_client)
+
+class CapabilitySchema(BaseModel):
+    """Shape every capability returned by the Notion source must have"""
+
+    model_config = ConfigDict(strict=True)
+
+    name: str
+    category: str
+    level: str
+    experience: str
+    examples: str
+
+
+CAPABILITIES_ADAPTER = TypeAdapter(list[CapabilitySchema])
+
+
+@pytest.fixture(scope="module")
+def profile_source(http_client):
+    """NotionProfileSource shared by every test in this module"""
+    notion_client = NotionKnowledge(config["NOTION_API_KEY"], http_client=http_client)
+    yield NotionProfileSource(notion_client)
+    notion_client.close()
 
 
 @pytest.mark.asyncio
-async def test_get_strategy(profile_source):
+async def test_get_strategy(profile_source, log_response):
     """Test fetching strategy from Notion"""
     strategy = await profile_source.get_strategy()
 
-    # Print final content only, with proper formatting
-    print("\nStrategy content:")
-    print("-" * 80)
-    print(strategy["content"])
-    print("-" * 80)
+    log_response("Strategy content", strategy["content"])
 
     # Basic response structure tests
     assert isinstance(strategy, dict)
@@ -33,13 +50,14 @@ async def test_get_strategy(profile_source):
 
 
 @pytest.mark.asyncio
-async def test_capability_content(profile_source):
+async def test_capability_content(profile_source, log_response):
     """Test actual content of capabilities"""
+    # Fetched inside the test so the request goes through this test's cassette
     capabilities = await profile_source.get_capabilities()
     capability = capabilities[0]
 
-    print("\nFirst capability data:")
-    print(
+    log_response(
+        "First capability data",
         json.dumps(
             {
                 "name": capability["name"],
@@ -49,7 +67,7 @@ async def test_capability_content(profile_source):
                 + "...",  # Truncate for readability
             },
             indent=2,
-        )
+        ),
     )
 
     # Verify values are from expected sets
@@ -63,6 +81,17 @@ async def test_capability_content(profile_source):
     assert capability["level"] in ["Expert", "Advanced", "Intermediate", "Basic"]
 
 
+@pytest.mark.asyncio
+async def test_fetch_profile_concurrently(profile_source):
+    """Test that strategy and capabilities can be fetched in parallel"""
+    strategy, capabilities = await asyncio.gather(
+        profile_source.get_strategy(), profile_source.get_capabilities()
+    )
+
+    assert strategy["content"]
+    assert len(capabilities) > 0
+
+
 @pytest.mark.asyncio
 async def test_capability_structure(profile_source):
     """Test structure of capabilities response"""
@@ -72,10 +101,8 @@ async def test_capability_structure(profile_source):
     assert isinstance(capabilities, list)
     assert len(capabilities) > 0
 
-    # Test first capability structure
-    capability = capabilities[0]
-    assert isinstance(capability, dict)
-    assert all(key in capability for key in ["name", "category", "level", "experience"])
+    # Validate every capability's keys and types in one pass
+    CAPABILITIES_ADAPTER.validate_python(capabilities)
 
 
 @pytest.mark.asyncio
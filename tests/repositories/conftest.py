@@ -0,0 +1,28 @@
+import os
+
+import pytest
+import pytest_asyncio
+
+from src.config import config
+from src.repositories.database import MongoDB
+
+
+@pytest_asyncio.fixture(scope="session")
+async def mongo_db():
+    """One test-database connection (and index setup) shared by the whole session"""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        # Give each pytest-xdist worker its own database so parallel test
+        # processes don't wipe each other's collections
+        worker = os.environ.get("PYTEST_XDIST_WORKER")
+        if worker:
+            monkeypatch.setitem(
+                config, "MONGODB_DB_NAME", f"{config['MONGODB_DB_NAME']}-{worker}"
+            )
+
+        await MongoDB.reset_instance()
+        db = await MongoDB.get_instance(is_test=True)
+        assert "test" in db.db.name.lower(), "Not using test database!"
+
+        yield db
+
+        await MongoDB.reset_instance()
@@ -1,10 +1,12 @@
+import asyncio
 from datetime import datetime, timedelta
 
 import pytest
 import pytest_asyncio
+from langchain_core.embeddings import DeterministicFakeEmbedding
 
 from src.repositories.companies import CompanyRepository
-from src.repositories.database import EntityNotFoundError, MongoDB, RepositoryError
+from src.repositories.database import EntityNotFoundError, RepositoryError
 from src.repositories.models import (
     Company,
     CompanyFilters,
@@ -17,15 +19,16 @@ logger = get_logger(__name__)
 
 
 @pytest_asyncio.fixture
-async def repository():
-    await MongoDB.reset_instance()
-    db = await MongoDB.get_instance(is_test=True)
-    repository = CompanyRepository(db)
+async def repository(mongo_db):
+    # Test search falls back to $text, so stored embeddings only need to be
+    # well-formed; a local deterministic embedder avoids OpenAI round-trips
+    repository = CompanyRepository(
+        mongo_db, embeddings=DeterministicFakeEmbedding(size=64)
+    )
 
     yield repository
 
     await repository.collection.delete_many({})
-    await MongoDB.reset_instance()
 
 
 @pytest.mark.asyncio
@@ -56,8 +59,9 @@ async def test_company_storage_operations(repository):
     )
 
     # Test Create
-    company1_id = await repository.create(company1)
-    company2_id = await repository.create(company2)
+    company1_id, company2_id = await asyncio.gather(
+        repository.create(company1), repository.create(company2)
+    )
     assert company1_id is not None
     assert company2_id is not None
 
@@ -109,7 +113,7 @@ async def test_company_storage_operations(repository):
 @pytest.mark.asyncio
 async def test_crud_operations(repository):
     """Test all CRUD operations thoroughly"""
-    logger.info("Starting CRUD operations test")
+    logger.debug("Starting CRUD operations test")
 
     # CREATE
     company = Company(
@@ -119,15 +123,15 @@ async def test_crud_operations(repository):
         stage=CompanyStage.SEED,
         website="https://test.com",
     )
-    logger.info(f"Creating test company: {company.name}")
+    logger.debug("Creating test company: %s", company.name)
     company_id = await repository.create(company)
-    logger.info(f"Created company with ID: {company_id}")
+    logger.debug("Created company with ID: %s", company_id)
     assert company_id is not None
 
     # READ
-    logger.info(f"Reading company with ID: {company_id}")
+    logger.debug("Reading company with ID: %s", company_id)
     stored_company = await repository.get(company_id)
-    logger.info(f"Retrieved company: {stored_company.name}")
+    logger.debug("Retrieved company: %s", stored_company.name)
     assert stored_company.name == "Test Corp"
     assert stored_company.industry == CompanyIndustry.SAAS
     assert stored_company.stage == CompanyStage.SEED
@@ -135,30 +139,30 @@ async def test_crud_operations(repository):
     # UPDATE
     stored_company.description = "Updated description"
     stored_company.stage = CompanyStage.SERIES_A
-    logger.info(f"Updating company {company_id} with new description and stage")
+    logger.debug("Updating company %s with new description and stage", company_id)
     success = await repository.update(company_id, stored_company)
     assert success is True
-    logger.info("Update successful")
+    logger.debug("Update successful")
 
     # Verify UPDATE
     updated_company = await repository.get(company_id)
-    logger.info(f"Retrieved updated company: {updated_company.description}")
+    logger.debug("Retrieved updated company: %s", updated_company.description)
     assert updated_company.description == "Updated description"
     assert updated_company.stage == CompanyStage.SERIES_A
     assert updated_company.created_at == stored_company.created_at
     assert updated_company.updated_at > stored_company.updated_at
 
     # DELETE
-    logger.info(f"Deleting company: {company_id}")
+    logger.debug("Deleting company: %s", company_id)
     success = await repository.delete(company_id)
     assert success is True
-    logger.info("Delete successful")
+    logger.debug("Delete successful")
 
     # Verify DELETE
-    logger.info("Verifying deletion")
+    logger.debug("Verifying deletion")
     with pytest.raises(EntityNotFoundError):
         await repository.get(company_id)
-    logger.info("Deletion verified - company not found as expected")
+    logger.debug("Deletion verified - company not found as expected")
 
 
 @pytest.mark.asyncio
@@ -198,7 +202,7 @@ async def test_error_handling(repository):
 @pytest.mark.asyncio
 async def test_search_and_filters(repository):
     """Test search and filter functionality"""
-    logger.info("Starting search and filters test")
+    logger.debug("Starting search and filters test")
 
     # Create test companies
     companies = [
@@ -218,38 +222,36 @@ async def test_search_and_filters(repository):
         ),
     ]
 
-    company_ids = []
-    for company in companies:
-        logger.info(f"Creating test company: {company.name}")
-        company_id = await repository.create(company)
-        company_ids.append(company_id)
-        logger.info(f"Created company with ID: {company_id}")
+    logger.debug("Creating %s test companies", len(companies))
+    company_ids = await repository.create_many(companies)
+    assert len(company_ids) == len(companies)
+    logger.debug("Created companies with IDs: %s", company_ids)
 
     # Test text search
-    logger.info("Testing text search for 'AI'")
+    logger.debug("Testing text search for 'AI'")
     results = await repository.search(query="AI")
     assert len(results) == 1
     assert results[0].name == "AI Corp"
-    logger.info(f"Found {len(results)} companies matching 'AI'")
+    logger.debug("Found %s companies matching 'AI'", len(results))
 
     # Test industry filter
-    logger.info("Testing industry filter for EDTECH")
+    logger.debug("Testing industry filter for EDTECH")
     filters = CompanyFilters(industries=[CompanyIndustry.EDTECH])
     results = await repository.search(filters=filters)
     assert len(results) == 1
     assert results[0].industry == CompanyIndustry.EDTECH
-    logger.info(f"Found {len(results)} companies in EDTECH industry")
+    logger.debug("Found %s companies in EDTECH industry", len(results))
 
     # Test stage filter
-    logger.info("Testing stage filter for SEED stage")
+    logger.debug("Testing stage filter for SEED stage")
     filters = CompanyFilters(stages=[CompanyStage.SEED])
     results = await repository.search(filters=filters)
     assert len(results) == 1
     assert results[0].stage == CompanyStage.SEED
-    logger.info(f"Found {len(results)} companies in SEED stage")
+    logger.debug("Found %s companies in SEED stage", len(results))
 
     # Test combined filters
-    logger.info("Testing combined industry and stage filters")
+    logger.debug("Testing combined industry and stage filters")
     filters = CompanyFilters(
         industries=[CompanyIndustry.SAAS, CompanyIndustry.EDTECH],
         stages=[CompanyStage.SERIES_A],
@@ -257,19 +259,18 @@ async def test_search_and_filters(repository):
     results = await repository.search(filters=filters)
     assert len(results) == 1
     assert results[0].name == "EdTech Corp"
-    logger.info(f"Found {len(results)} companies matching combined filters")
+    logger.debug("Found %s companies matching combined filters", len(results))
 
     # Cleanup
-    logger.info("Cleaning up test companies")
-    for company_id in company_ids:
-        await repository.delete(company_id)
-    logger.info("Test companies deleted")
+    logger.debug("Cleaning up test companies")
+    await asyncio.gather(*(repository.delete(id) for id in company_ids))
+    logger.debug("Test companies deleted")
 
 
 @pytest.mark.asyncio
 async def test_vector_search(repository):
     """Test vector search functionality"""
-    logger.info("Starting vector search test")
+    logger.debug("Starting vector search test")
 
     # Create test companies with diverse descriptions
     companies = [
@@ -289,8 +290,7 @@ async def test_vector_search(repository):
         ),
     ]
 
-    for company in companies:
-        await repository.create(company)
+    await repository.create_many(companies)
 
     # Test semantic search
     results = await repository.search_similar(
@@ -1,12 +1,14 @@
+import asyncio
 from datetime import datetime, timedelta
 
 import pytest
 import pytest_asyncio
+from langchain_core.embeddings import DeterministicFakeEmbedding
 from pydantic import ValidationError
 
 from src.repositories.companies import CompanyRepository
-from src.repositories.database import EntityNotFoundError, MongoDB, RepositoryError
-from src.repositories.jobs import JobRepository
+from src.repositories.database import EntityNotFoundError, RepositoryError
+from src.repositories.jobs import JobEvaluation, JobRepository
 from src.repositories.models import (
     Company,
     CompanyFilters,
@@ -18,22 +20,89 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Assertions below never read the stored vectors, the bulk of each job document
+_WITHOUT_EMBEDDINGS = {"description_embedding": 0, "requirements_embedding": 0}
+
+# Known-good data for the advanced scenarios, built with model_construct to skip
+# validation; test_company_job_workflow still exercises the validating models
+_COMPANY_TEMPLATES = [
+    {
+        "name": "AI Startup",
+        "description": "Early-stage AI research and development",
+        "industry": CompanyIndustry.SAAS,
+        "stage": CompanyStage.SEED,
+        "website": "https://ai-startup.com",
+        "company_fit_score": 0.92,
+    },
+    {
+        "name": "Data Analytics Corp",
+        "description": "Enterprise data analytics solutions",
+        "industry": CompanyIndustry.SAAS,
+        "stage": CompanyStage.SERIES_A,
+        "website": "https://data-analytics.com",
+        "company_fit_score": 0.78,
+    },
+]
+
+_JOB_TEMPLATES = {
+    # High-match jobs for AI Startup
+    "AI Startup": [
+        {
+            "title": "ML Research Engineer",
+            "description": "Deep learning research and implementation",
+            "requirements": ["PyTorch", "Research Experience", "PhD preferred"],
+            "salary_range": (130000, 180000),
+            "active": True,
+        },
+        {
+            "title": "AI Product Manager",
+            "description": "Lead AI product development",
+            "requirements": ["Product Management", "AI Experience", "Agile"],
+            "salary_range": (140000, 190000),
+            "active": True,
+        },
+    ],
+    # Mixed-match jobs for Data Analytics Corp
+    "Data Analytics Corp": [
+        {
+            "title": "Data Engineer",
+            "description": "Build data pipelines and analytics infrastructure",
+            "requirements": ["Python", "SQL", "Spark", "Airflow"],
+            "salary_range": (120000, 160000),
+            "active": True,
+        },
+        {
+            "title": "Frontend Developer",
+            "description": "Build data visualization interfaces",
+            "requirements": ["React", "D3.js", "TypeScript"],
+            "salary_range": (100000, 140000),
+            "active": True,
+        },
+    ],
+}
+
+
+@pytest.fixture(scope="module")
+def repositories(mongo_db):
+    """Setup test repositories on the shared test database"""
+    # search_similar falls back to $text in the test database, so a local
+    # deterministic embedder is enough and avoids OpenAI round-trips
+    embeddings = DeterministicFakeEmbedding(size=64)
+    company_repo = CompanyRepository(mongo_db, embeddings=embeddings)
+    job_repo = JobRepository(mongo_db, embeddings=embeddings)
+    return company_repo, job_repo
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def clean_collections(repositories):
+    """Empty both collections after every test"""
+    yield
 
-@pytest_asyncio.fixture
-async def repositories():
-    """Setup test repositories with clean database"""
-    await MongoDB.reset_instance()
-    db = await MongoDB.get_instance(is_test=True)
-
-    company_repo = CompanyRepository(db)
-    job_repo = JobRepository(db)
-
-    yield company_repo, job_repo
-
-    # Cleanup
-    await company_repo.collection.delete_many({})
-    await job_repo.collection.delete_many({})
-    await MongoDB.reset_instance()
+    company_repo, job_repo = repositories
+    await asyncio.gather(
+        company_repo.collection.delete_many({}),
+        job_repo.collection.delete_many({}),
+    )
 
 
 @pytest.mark.asyncio
@@ -41,6 +110,7 @@ async def test_company_job_workflow(repositories):
     """Test complete workflow of company discovery and job management"""
     company_repo, job_repo = repositories
     logger.info("Starting company-job workflow test")
+    now = datetime.now()
 
     # 1. Create company (simulating company research agent results)
     company = Company(
@@ -50,8 +120,8 @@ async def test_company_job_workflow(repositories):
         stage=CompanyStage.SEED,
         website="https://techcorp-ai.com",
         company_fit_score=0.85,  # High company fit
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
+        created_at=now,
+        updated_at=now,
     )
 
     company_id = await company_repo.create(company)
@@ -77,36 +147,36 @@ async def test_company_job_workflow(repositories):
         ),
     ]
 
-    job_ids = []
-    for job in jobs:
-        job_id = await job_repo.create(job)
-        job_ids.append(job_id)
-        logger.info(f"Created job: {job_id}")
+    job_ids = await job_repo.create_many(jobs)
+    logger.info(f"Created jobs: {job_ids}")
 
     # 3. Test job evaluations
-    await job_repo.update_evaluation(
-        job_ids[0],
-        match_score=0.9,  # High match for ML role
-        skills_match=["Python", "PyTorch"],
-        notes="Strong match for ML skills",
-    )
-
-    await job_repo.update_evaluation(
-        job_ids[1],
-        match_score=0.6,  # Lower match for DevOps
-        skills_match=["AWS"],
-        notes="Partial match for cloud skills",
+    await asyncio.gather(
+        job_repo.update_evaluation(
+            job_ids[0],
+            match_score=0.9,  # High match for ML role
+            skills_match=["Python", "PyTorch"],
+            notes="Strong match for ML skills",
+        ),
+        job_repo.update_evaluation(
+            job_ids[1],
+            match_score=0.6,  # Lower match for DevOps
+            skills_match=["AWS"],
+            notes="Partial match for cloud skills",
+        ),
     )
 
     # 4. Verify company's jobs
-    company_jobs = await job_repo.get_company_jobs(company_id)
+    company_jobs = await job_repo.get_company_jobs(
+        company_id, projection=_WITHOUT_EMBEDDINGS
+    )
     assert len(company_jobs) == 2
-    assert any(job.match_score == 0.9 for job in company_jobs)
-    assert any(job.match_score == 0.6 for job in company_jobs)
+    scores_by_title = {job.title: job.match_score for job in company_jobs}
+    assert scores_by_title["Senior ML Engineer"] == 0.9
+    assert scores_by_title["DevOps Engineer"] == 0.6
 
     # 5. Test company update scenario
     company.stage = CompanyStage.SERIES_A
-    company.updated_at = datetime.now()
     success = await company_repo.update(company_id, company)
     assert success is True
 
@@ -117,23 +187,27 @@ async def test_company_job_workflow(repositories):
     await job_repo.archive_job(job_ids[1])  # Archive DevOps position
 
     # Verify active vs archived jobs
-    active_jobs = await job_repo.get_company_jobs(company_id, include_archived=False)
+    all_jobs = await job_repo.get_company_jobs(
+        company_id, include_archived=True, projection=_WITHOUT_EMBEDDINGS
+    )
+    active_jobs = [job for job in all_jobs if job.active]
     assert len(active_jobs) == 1
     assert active_jobs[0].title == "Senior ML Engineer"
-
-    all_jobs = await job_repo.get_company_jobs(company_id, include_archived=True)
     assert len(all_jobs) == 2
 
-    # 7. Test searching for best matches
-    best_matches = await job_repo.get_best_matches(min_score=0.8)
+    # 7. Test searching for best matches, and
+    # 8. Test company similarity search
+    best_matches, similar_companies = await asyncio.gather(
+        job_repo.get_best_matches(min_score=0.8),
+        company_repo.search_similar(
+            description="AI infrastructure and machine learning solutions",
+            min_score=0.7,
+        ),
+    )
     assert len(best_matches) == 1
     assert best_matches[0].match_score >= 0.8
     assert best_matches[0].title == "Senior ML Engineer"
 
-    # 8. Test company similarity search
-    similar_companies = await company_repo.search_similar(
-        description="AI infrastructure and machine learning solutions", min_score=0.7
-    )
     assert len(similar_companies) > 0
     assert similar_companies[0].name == "TechCorp AI"
 
@@ -145,119 +219,68 @@ async def test_advanced_company_job_scenarios(repositories):
     """Test advanced scenarios for company and job interactions"""
     company_repo, job_repo = repositories
     logger.info("Starting advanced company-job scenarios test")
+    now = datetime.now()
 
     # 1. Create multiple companies in different stages/industries
     companies = [
-        Company(
-            name="AI Startup",
-            description="Early-stage AI research and development",
-            industry=CompanyIndustry.SAAS,
-            stage=CompanyStage.SEED,
-            website="https://ai-startup.com",
-            company_fit_score=0.92,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Company(
-            name="Data Analytics Corp",
-            description="Enterprise data analytics solutions",
-            industry=CompanyIndustry.SAAS,
-            stage=CompanyStage.SERIES_A,
-            website="https://data-analytics.com",
-            company_fit_score=0.78,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
+        Company.model_construct(**template, created_at=now, updated_at=now)
+        for template in _COMPANY_TEMPLATES
     ]
 
-    company_ids = []
-    for company in companies:
-        company_id = await company_repo.create(company)
-        company_ids.append(company_id)
-        logger.info(f"Created company: {company_id}")
+    company_ids = await company_repo.create_many(companies)
+    logger.info(f"Created companies: {company_ids}")
 
     # 2. Add multiple jobs with varying characteristics
     jobs_data = [
-        # High-match jobs for AI Startup
         (
-            company_ids[0],
+            company_id,
             [
-                JobAd(
-                    company_id=company_ids[0],
-                    title="ML Research Engineer",
-                    description="Deep learning research and implementation",
-                    requirements=["PyTorch", "Research Experience", "PhD preferred"],
-                    salary_range=(130000, 180000),
-                    active=True,
-                ),
-                JobAd(
-                    company_id=company_ids[0],
-                    title="AI Product Manager",
-                    description="Lead AI product development",
-                    requirements=["Product Management", "AI Experience", "Agile"],
-                    salary_range=(140000, 190000),
-                    active=True,
-                ),
+                JobAd.model_construct(**template, company_id=company_id)
+                for template in _JOB_TEMPLATES[company.name]
             ],
-        ),
-        # Mixed-match jobs for Data Analytics Corp
-        (
-            company_ids[1],
-            [
-                JobAd(
-                    company_id=company_ids[1],
-                    title="Data Engineer",
-                    description="Build data pipelines and analytics infrastructure",
-                    requirements=["Python", "SQL", "Spark", "Airflow"],
-                    salary_range=(120000, 160000),
-                    active=True,
-                ),
-                JobAd(
-                    company_id=company_ids[1],
-                    title="Frontend Developer",
-                    description="Build data visualization interfaces",
-                    requirements=["React", "D3.js", "TypeScript"],
-                    salary_range=(100000, 140000),
-                    active=True,
-                ),
-            ],
-        ),
+        )
+        for company_id, company in zip(company_ids, companies)
     ]
 
-    all_job_ids = []
-    for company_id, jobs in jobs_data:
-        for job in jobs:
-            job_id = await job_repo.create(job)
-            all_job_ids.append(job_id)
-            logger.info(f"Created job: {job_id}")
+    all_job_ids = await job_repo.create_many(
+        [job for _, jobs in jobs_data for job in jobs]
+    )
+    logger.info(f"Created jobs: {all_job_ids}")
 
     # 3. Test complex search scenarios
-    # 3.1 Find AI companies with high match scores
-    ai_companies = await company_repo.search(
-        query="AI",
-        filters=CompanyFilters(industries=[CompanyIndustry.SAAS], min_match_score=0.9),
+    # 3.1 Find AI companies with high match scores, and
+    # 3.2 Test similar company search
+    ai_companies, similar_companies = await asyncio.gather(
+        company_repo.search(
+            query="AI",
+            filters=CompanyFilters(
+                industries=[CompanyIndustry.SAAS], min_match_score=0.9
+            ),
+        ),
+        company_repo.search_similar(
+            description="AI and machine learning research company", min_score=0.7
+        ),
     )
     assert len(ai_companies) == 1
     assert ai_companies[0].name == "AI Startup"
-
-    # 3.2 Test similar company search
-    similar_companies = await company_repo.search_similar(
-        description="AI and machine learning research company", min_score=0.7
-    )
     assert len(similar_companies) > 0
     assert "AI" in similar_companies[0].name
 
     # 4. Test job evaluation scenarios
     # 4.1 Evaluate jobs with different match levels
     evaluations = [
-        (all_job_ids[0], 0.95, ["PyTorch", "Research"], "Perfect fit for ML research"),
-        (all_job_ids[1], 0.82, ["Product Management"], "Good product role match"),
-        (all_job_ids[2], 0.75, ["Python", "SQL"], "Partial skills match"),
-        (all_job_ids[3], 0.45, ["React"], "Limited frontend experience"),
+        JobEvaluation(
+            all_job_ids[0], 0.95, ["PyTorch", "Research"], "Perfect fit for ML research"
+        ),
+        JobEvaluation(
+            all_job_ids[1], 0.82, ["Product Management"], "Good product role match"
+        ),
+        JobEvaluation(all_job_ids[2], 0.75, ["Python", "SQL"], "Partial skills match"),
+        JobEvaluation(all_job_ids[3], 0.45, ["React"], "Limited frontend experience"),
     ]
 
-    for job_id, score, skills, notes in evaluations:
-        await job_repo.update_evaluation(job_id, score, skills, notes)
+    evaluated = await job_repo.update_evaluations_bulk(evaluations)
+    assert evaluated == len(evaluations)
 
     # 4.2 Test finding best matches across all companies
     best_matches = await job_repo.get_best_matches(min_score=0.8)
@@ -265,20 +288,20 @@ async def test_advanced_company_job_scenarios(repositories):
     assert all(job.match_score >= 0.8 for job in best_matches)
 
     # 5. Test company stage transition effects
-    # 5.1 Update company stage and verify jobs
+    # 5.1 Update company stage, and
+    # 5.2 Archive some jobs alongside the company update
     company = companies[0]
     company.stage = CompanyStage.SERIES_A
-    company.updated_at = datetime.now()
-    await company_repo.update(company_ids[0], company)
-
-    # 5.2 Archive some jobs after company update
-    await job_repo.archive_job(all_job_ids[1])  # Archive AI Product Manager role
+    await asyncio.gather(
+        company_repo.update(company_ids[0], company),
+        job_repo.archive_job(all_job_ids[1]),  # Archive AI Product Manager role
+    )
 
     # 5.3 Verify active vs archived jobs for the company
-    active_jobs = await job_repo.get_company_jobs(
-        company_ids[0], include_archived=False
+    all_jobs = await job_repo.get_company_jobs(
+        company_ids[0], include_archived=True, projection=_WITHOUT_EMBEDDINGS
     )
-    all_jobs = await job_repo.get_company_jobs(company_ids[0], include_archived=True)
+    active_jobs = [job for job in all_jobs if job.active]
     assert len(active_jobs) == 1
     assert len(all_jobs) == 2
 
@@ -297,6 +320,7 @@ async def test_error_and_bulk_scenarios(repositories):
     """Test error handling and bulk operations for companies and jobs"""
     company_repo, job_repo = repositories
     logger.info("Starting error handling and bulk operations test")
+    now = datetime.now()
 
     # 1. Setup test company
     company = Company(
@@ -306,10 +330,11 @@ async def test_error_and_bulk_scenarios(repositories):
         stage=CompanyStage.SEED,
         website="https://techsolutions.com",
         company_fit_score=0.80,
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
+        created_at=now,
+        updated_at=now,
     )
-    company_id = await company_repo.create(company)
+    # Nothing in this test runs a similarity search, so skip embeddings throughout
+    company_id = await company_repo.create(company, compute_embedding=False)
 
     # 2. Test error handling scenarios
     # 2.1 Invalid job evaluation score
@@ -321,7 +346,7 @@ async def test_error_and_bulk_scenarios(repositories):
         salary_range=(100000, 150000),
         active=True,
     )
-    original_job_id = await job_repo.create(job)
+    original_job_id = await job_repo.create(job, compute_embedding=False)
 
     with pytest.raises(ValueError):
         await job_repo.update_evaluation(
@@ -346,7 +371,7 @@ async def test_error_and_bulk_scenarios(repositories):
         active=True,
     )
     # This should create the job but might cause issues in related operations
-    invalid_job_id = await job_repo.create(invalid_job)
+    invalid_job_id = await job_repo.create(invalid_job, compute_embedding=False)
 
     # Verify we can still get this job despite invalid company reference
     retrieved_job = await job_repo.get(invalid_job_id)
@@ -366,10 +391,7 @@ async def test_error_and_bulk_scenarios(repositories):
         for i in range(5)
     ]
 
-    bulk_job_ids = []
-    for job in bulk_jobs:
-        job_id = await job_repo.create(job)
-        bulk_job_ids.append(job_id)
+    bulk_job_ids = await job_repo.create_many(bulk_jobs, compute_embedding=False)
 
     # 3.2 Bulk job evaluation
     evaluation_data = [
@@ -390,20 +412,21 @@ async def test_error_and_bulk_scenarios(repositories):
     )
     assert success is True, "Failed to evaluate original job"
 
-    # Verify the original job evaluation worked
-    original_job = await job_repo.get(original_job_id)
-    logger.info(
-        f"Original job after evaluation - match_score: {original_job.match_score}"
-    )
-    assert original_job.match_score == 0.70, "Original job evaluation didn't persist"
-
     # Then evaluate all bulk jobs
-    for bulk_job_id, (score, skills, notes) in zip(bulk_job_ids, evaluation_data):
-        success = await job_repo.update_evaluation(bulk_job_id, score, skills, notes)
-        assert success is True, f"Failed to evaluate bulk job {bulk_job_id}"
+    evaluated = await job_repo.update_evaluations_bulk(
+        [
+            JobEvaluation(bulk_job_id, score, skills, notes)
+            for bulk_job_id, (score, skills, notes) in zip(
+                bulk_job_ids, evaluation_data
+            )
+        ]
+    )
+    assert evaluated == len(bulk_job_ids), "Failed to evaluate every bulk job"
 
     # 3.3 Verify bulk evaluations
-    evaluated_jobs = await job_repo.get_company_jobs(company_id)
+    evaluated_jobs = await job_repo.get_company_jobs(
+        company_id, projection=_WITHOUT_EMBEDDINGS
+    )
 
     # Debug: Print each job's match score
     for job in evaluated_jobs:
@@ -422,35 +445,38 @@ async def test_error_and_bulk_scenarios(repositories):
 
     # 3.4 Test company stage change affecting all jobs
     company.stage = CompanyStage.SERIES_A
-    company.updated_at = datetime.now()
     await company_repo.update(company_id, company)
 
     # 3.5 Bulk archive jobs based on criteria
-    low_scoring_jobs = [
-        job for job in evaluated_jobs if job.match_score and job.match_score < 0.8
+    low_scoring_ids = [
+        job.id
+        for job in evaluated_jobs
+        if job.match_score is not None and job.match_score < 0.8
     ]
-    for job in low_scoring_jobs:
-        await job_repo.archive_job(str(job.id))
-
-    # 3.6 Verify bulk archiving
-    active_jobs = await job_repo.get_company_jobs(company_id, include_archived=False)
-    archived_jobs = await job_repo.get_company_jobs(company_id, include_archived=True)
-    assert len(active_jobs) < len(archived_jobs)
-    assert all(job.match_score >= 0.8 for job in active_jobs)
-
-    # 4. Test data consistency
-    # 4.1 Verify all jobs have proper timestamps
-    all_jobs = await job_repo.get_company_jobs(company_id, include_archived=True)
-    for job in all_jobs:
+    await job_repo.archive_jobs(low_scoring_ids)
+
+    # 3.6 Verify bulk archiving, and
+    # 4. Test data consistency, checked in a single streamed pass
+    active_count = total_count = 0
+    async for job in job_repo.stream_company_jobs(
+        company_id, include_archived=True, projection=_WITHOUT_EMBEDDINGS
+    ):
+        total_count += 1
+        if job.active:
+            active_count += 1
+            assert job.match_score >= 0.8
+
+        # 4.1 Verify all jobs have proper timestamps
         assert job.created_at is not None
         if not job.active:
             assert job.archived_at is not None
         if job.match_score is not None:
             assert job.evaluated_at is not None
 
-    # 4.2 Verify company relationship integrity
-    company_jobs = await job_repo.get_company_jobs(company_id, include_archived=True)
-    assert all(job.company_id == company_id for job in company_jobs)
+        # 4.2 Verify company relationship integrity
+        assert job.company_id == company_id
+
+    assert active_count < total_count
 
     logger.info("Completed error handling and bulk operations test")
 
@@ -460,6 +486,7 @@ async def test_company_lifecycle_scenarios(repositories):
     """Test company lifecycle and its impact on jobs"""
     company_repo, job_repo = repositories
     logger.info("Starting company lifecycle test")
+    now = datetime.now()
 
     # 1. Setup: Create company with multiple jobs
     company = Company(
@@ -469,8 +496,8 @@ async def test_company_lifecycle_scenarios(repositories):
         stage=CompanyStage.SEED,
         website="https://growth-startup.com",
         company_fit_score=0.88,
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
+        created_at=now,
+        updated_at=now,
     )
     company_id = await company_repo.create(company)
 
@@ -494,54 +521,49 @@ async def test_company_lifecycle_scenarios(repositories):
         ),
     ]
 
-    job_ids = []
-    for job in jobs:
-        job_id = await job_repo.create(job)
-        job_ids.append(job_id)
+    job_ids = await job_repo.create_many(jobs)
 
     # 2. Test company stage transitions
-    # 2.1 Seed to Series A transition
-    company.stage = CompanyStage.SERIES_A
-    company.updated_at = datetime.now()
-    await company_repo.update(company_id, company)
-
-    # Verify company update
-    updated_company = await company_repo.get(company_id)
-    assert updated_company.stage == CompanyStage.SERIES_A
-
+    # 2.1 Seed to Series A transition, and
     # 2.2 Update job requirements after funding
+    company.stage = CompanyStage.SERIES_A
     new_requirements = ["Python", "Leadership", "Scale Experience"]
-    await job_repo.update(job_ids[0], {"requirements": new_requirements})
+    await asyncio.gather(
+        company_repo.update(company_id, company),
+        job_repo.update(job_ids[0], {"requirements": new_requirements}),
+    )
 
-    updated_job = await job_repo.get(job_ids[0])
+    # Verify company and job updates
+    updated_company, updated_job = await asyncio.gather(
+        company_repo.get(company_id), job_repo.get(job_ids[0])
+    )
+    assert updated_company.stage == CompanyStage.SERIES_A
     assert "Scale Experience" in updated_job.requirements
 
     # 3. Test company search with multiple criteria
-    # 3.1 Search by industry and stage
-    series_a_companies = await company_repo.search(
-        filters=CompanyFilters(
-            industries=[CompanyIndustry.SAAS],
-            stages=[CompanyStage.SERIES_A],
-            min_match_score=0.8,
-        )
+    # 3.1 Search by industry and stage, and
+    # 3.2 Search by date range
+    series_a_companies, recent_companies = await asyncio.gather(
+        company_repo.search(
+            filters=CompanyFilters(
+                industries=[CompanyIndustry.SAAS],
+                stages=[CompanyStage.SERIES_A],
+                min_match_score=0.8,
+            )
+        ),
+        company_repo.search(
+            filters=CompanyFilters(
+                date_from=now - timedelta(hours=1),
+                date_to=now + timedelta(hours=1),
+            )
+        ),
     )
     assert len(series_a_companies) == 1
     assert series_a_companies[0].name == "Growth Startup"
-
-    # 3.2 Search by date range
-    recent_companies = await company_repo.search(
-        filters=CompanyFilters(
-            date_from=datetime.now() - timedelta(hours=1),
-            date_to=datetime.now() + timedelta(hours=1),
-        )
-    )
     assert len(recent_companies) > 0
 
     # 4. Test job archiving scenarios
     # 4.1 Archive job with replacement
-    await job_repo.archive_job(job_ids[0])  # Archive Senior Developer role
-
-    # Create replacement job
     new_job = JobAd(
         company_id=company_id,
         title="Engineering Manager",  # Upgraded role
@@ -550,13 +572,17 @@ async def test_company_lifecycle_scenarios(repositories):
         salary_range=(150000, 200000),
         active=True,
     )
-    new_job_id = await job_repo.create(new_job)
+    _, new_job_id = await asyncio.gather(
+        job_repo.archive_job(job_ids[0]),  # Archive Senior Developer role
+        job_repo.create(new_job),  # Create replacement job
+    )
 
     # 4.2 Verify active vs archived jobs
-    active_jobs = await job_repo.get_company_jobs(company_id, include_archived=False)
+    all_jobs = await job_repo.get_company_jobs(
+        company_id, include_archived=True, projection=_WITHOUT_EMBEDDINGS
+    )
+    active_jobs = [job for job in all_jobs if job.active]
     assert len(active_jobs) == 2  # Product Designer + Engineering Manager
-
-    all_jobs = await job_repo.get_company_jobs(company_id, include_archived=True)
     assert len(all_jobs) == 3  # Including archived Senior Developer
 
     # 4.3 Verify job history is maintained
@@ -579,6 +605,7 @@ async def test_edge_cases_and_validations(repositories):
     """Test edge cases and validation scenarios"""
     company_repo, job_repo = repositories
     logger.info("Starting edge cases and validation test")
+    now = datetime.now()
 
     # 1. Test empty description handling
     company = Company(
@@ -588,33 +615,33 @@ async def test_edge_cases_and_validations(repositories):
         stage=CompanyStage.SEED,
         website="https://empty-desc.com",
         company_fit_score=0.75,
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
+        created_at=now,
+        updated_at=now,
     )
     company_id = await company_repo.create(company)
     assert company_id, "Should handle empty description"
 
-    # 2. Test combined search criteria
-    companies = await company_repo.search(
-        query="Empty",  # Text search
-        filters=CompanyFilters(  # Combined with filters
-            industries=[CompanyIndustry.SAAS],
-            stages=[CompanyStage.SEED],
-            min_match_score=0.7,
+    # 2. Test combined search criteria,
+    # 3. Test empty search results, and
+    # 4. Test vector search with min_score
+    companies, no_results, similar_companies = await asyncio.gather(
+        company_repo.search(
+            query="Empty",  # Text search
+            filters=CompanyFilters(  # Combined with filters
+                industries=[CompanyIndustry.SAAS],
+                stages=[CompanyStage.SEED],
+                min_match_score=0.7,
+            ),
+            limit=5,
+        ),
+        company_repo.search(query="NonexistentCompany123", limit=10),
+        company_repo.search_similar(
+            description="Software company", min_score=0.99  # Very high threshold
         ),
-        limit=5,
     )
     assert len(companies) == 1
     assert companies[0].name == "Empty Desc Co"
-
-    # 3. Test empty search results
-    no_results = await company_repo.search(query="NonexistentCompany123", limit=10)
     assert len(no_results) == 0
-
-    # 4. Test vector search with min_score
-    similar_companies = await company_repo.search_similar(
-        description="Software company", min_score=0.99  # Very high threshold
-    )
     assert (
         len(similar_companies) == 0
     )  # Should find no matches with such high threshold
@@ -651,8 +678,8 @@ async def test_edge_cases_and_validations(repositories):
         stage=CompanyStage.SEED,
         website="https://empty-desc.com",  # Same website
         company_fit_score=0.75,
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
+        created_at=now,
+        updated_at=now,
     )
     with pytest.raises(RepositoryError):
         await company_repo.create(duplicate_company)
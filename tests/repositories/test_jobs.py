@@ -2,8 +2,9 @@ from datetime import datetime, timedelta
 
 import pytest
 import pytest_asyncio
+from langchain_core.embeddings import DeterministicFakeEmbedding
 
-from src.repositories.database import EntityNotFoundError, MongoDB, RepositoryError
+from src.repositories.database import EntityNotFoundError, RepositoryError
 from src.repositories.jobs import JobRepository
 from src.repositories.models import JobAd
 from src.utils.logger import get_logger
@@ -12,23 +13,16 @@ logger = get_logger(__name__)
 
 
 @pytest_asyncio.fixture
-async def repository():
-    """Create a test storage instance with proper test database"""
-    # Reset MongoDB instance to ensure clean state
-    await MongoDB.reset_instance()
-
-    # Get storage instance with test flag
-    db = await MongoDB.get_instance(is_test=True)
-    repository = JobRepository(db)
-
-    # Ensure we're using test database
-    assert "test" in repository.db.db.name.lower(), "Not using test database!"
+async def repository(mongo_db):
+    """Job repository on the shared test database, emptied after each test"""
+    # Test search falls back to $text, so stored embeddings only need to be
+    # well-formed; a local deterministic embedder avoids OpenAI round-trips
+    repository = JobRepository(mongo_db, embeddings=DeterministicFakeEmbedding(size=64))
 
     yield repository
 
     # Cleanup after tests
     await repository.collection.delete_many({})
-    await MongoDB.reset_instance()
 
 
 @pytest.mark.asyncio
@@ -142,6 +136,12 @@ async def test_error_handling(repository):
             notes="Test",
         )
 
+    # Inclusion projections would leave required JobAd fields unset
+    with pytest.raises(ValueError):
+        await repository.get_company_jobs("company123", projection={"title": 1})
+    with pytest.raises(ValueError):
+        await repository.get_company_jobs("company123", projection={"_id": 0})
+
 
 @pytest.mark.asyncio
 async def test_job_lifecycle(repository):
@@ -197,8 +197,7 @@ async def test_cleanup(repository):
         for i in range(3)
     ]
 
-    for job in jobs:
-        await repository.create(job)
+    await repository.create_many(jobs)
 
     # Verify cleanup
     await repository.cleanup_test_data()
@@ -227,8 +226,7 @@ async def test_vector_search(repository):
         ),
     ]
 
-    for job in jobs:
-        await repository.create(job)
+    await repository.create_many(jobs)
 
     # Test semantic search
     results = await repository.search_similar(
@@ -1,4 +1,6 @@
 import os
+import threading
+import time
 from unittest.mock import MagicMock
 
 import pytest
@@ -26,6 +28,7 @@ def mock_cache_manager(mocker):
     """Fixture to mock CacheManager."""
     mock_cache = MagicMock()
     mock_cache.get = MagicMock(return_value=None)
+    mock_cache.get_many = MagicMock(side_effect=lambda keys: [None] * len(keys))
     mock_cache.set = MagicMock()
     mocker.patch("src.services.scrapers.zenrows.CacheManager", return_value=mock_cache)
     return mock_cache
@@ -101,15 +104,8 @@ async def test_scrape_multiple(scraper, mock_zenrows_client, mock_cache_manager)
     mock_response2.headers = {"Content-Type": "text/html"}
 
     # Configure the mock to return different responses based on input URL
-    def get_side_effect(url, params):
-        if url == urls[0]:
-            return mock_response1
-        elif url == urls[1]:
-            return mock_response2
-        else:
-            raise ValueError("Unknown URL")
-
-    mock_zenrows_client.get.side_effect = get_side_effect
+    responses_by_url = {urls[0]: mock_response1, urls[1]: mock_response2}
+    mock_zenrows_client.get.side_effect = lambda url, params: responses_by_url[url]
 
     responses = await scraper.scrape_multiple(urls)
 
@@ -125,11 +121,45 @@ async def test_scrape_multiple(scraper, mock_zenrows_client, mock_cache_manager)
     assert responses[1].url == urls[1]
     assert responses[1].error is None
 
-    # Ensure cache was checked and set for each URL
-    assert mock_cache_manager.get.call_count == 2
+    # Ensure cache was checked once for all URLs and set for each URL
+    mock_cache_manager.get_many.assert_called_once()
+    mock_cache_manager.get.assert_not_called()
     assert mock_cache_manager.set.call_count == 2
 
 
+@pytest.mark.asyncio
+async def test_scrape_multiple_limits_concurrency(
+    mock_zenrows_client, mock_cache_manager, mock_logger
+):
+    """Test that batch scraping overlaps requests up to max_concurrency."""
+    urls = [f"https://www.example.com/{i}" for i in range(6)]
+    mock_response = MagicMock()
+    mock_response.text = "<html>Content</html>"
+    mock_response.status_code = 200
+    mock_response.headers = {"Content-Type": "text/html"}
+
+    lock = threading.Lock()
+    in_flight = peak = 0
+
+    def slow_get(url, params):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+        return mock_response
+
+    mock_zenrows_client.get.side_effect = slow_get
+    scraper = ZenrowsScraper(max_concurrency=2)
+
+    responses = await scraper.scrape_multiple(urls)
+
+    assert [response.url for response in responses] == urls
+    assert peak == 2
+
+
 @pytest.mark.asyncio
 async def test_custom_options(scraper, mock_zenrows_client, mock_cache_manager):
     """Test scraping with custom options."""
@@ -258,6 +288,7 @@ async def test_cache_separate_keys(scraper, mock_zenrows_client, mock_cache_mana
 # ----------------------------
 
 
+@pytest.mark.live
 @pytest.mark.integration
 @pytest.mark.asyncio
 async def test_real_scrape():
@@ -1,20 +1,16 @@
-import os
-import shutil
-
 import pytest
 
 from src.cache import CacheManager
 
 
 @pytest.fixture
-def cache_manager():
+def cache_manager(tmp_path):
     """Fixture to create a CacheManager instance for testing."""
-    cache_directory = "test_cache_directory"
-    cache = CacheManager(cache_directory=cache_directory)
+    # A per-test directory keeps parallel xdist workers from sharing one cache
+    cache = CacheManager(cache_directory=str(tmp_path / "cache"))
     yield cache
     # Cleanup after tests
     cache.clear()
-    shutil.rmtree(cache_directory)  # Remove the directory and its contents
 
 
 def test_set_and_get(cache_manager):
@@ -28,6 +24,17 @@ def test_get_non_existent_key(cache_manager):
     assert cache_manager.get("non_existent_key") is None
 
 
+def test_get_many(cache_manager):
+    """Test getting several values at once, with None for missing keys."""
+    cache_manager.set("key1", "value1")
+    cache_manager.set("key2", "value2")
+    assert cache_manager.get_many(["key1", "missing", "key2"]) == [
+        "value1",
+        None,
+        "value2",
+    ]
+
+
 def test_clear(cache_manager):
     """Test clearing the cache."""
     cache_manager.set("key1", "value1")